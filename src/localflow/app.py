@@ -1,29 +1,38 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import queue
 import threading
+from typing import TYPE_CHECKING, Any, Callable
 import time
 import sys
-import re
-
-from pynput import keyboard
 
 from localflow.audio import AudioRecorder
 from localflow.commands import apply_voice_commands
 from localflow.config import FlowConfig
 from localflow.enhance import LocalEnhancer
 from localflow.history import append_history
-from localflow.output import emit_text
-from localflow.transcribe import WhisperTranscriber
+from localflow.output import emit_text, preload_paste_backend
+
+if TYPE_CHECKING:
+    import numpy as np
+    from pynput import keyboard
+
+    from localflow.transcribe import WhisperTranscriber
+
+# How often the streaming thread checks for a full chunk while recording.
+_CHUNK_POLL_SECONDS = 0.25
+_WORKER_JOIN_TIMEOUT_SECONDS = 1.0
 
 
 class LocalFlowApp:
     def __init__(self, config: FlowConfig) -> None:
         if sys.platform != "darwin":
             raise RuntimeError("LocalFlow supports macOS only.")
+        from pynput import keyboard
+
         self.config = config
         self.recorder = AudioRecorder(sample_rate=config.sample_rate)
-        self.transcriber = WhisperTranscriber(model_name=config.whisper_model)
+        self._transcriber: WhisperTranscriber | None = None
         self.enhancer = LocalEnhancer(
             enabled=config.enable_enhancer,
             model_path=config.enhancer_model_path,
@@ -31,25 +40,83 @@ class LocalFlowApp:
         )
 
         self._listener: keyboard.Listener | None = None
-        self._side_specific_hotkey = bool(re.search(r"<(?:cmd|ctrl|shift|alt)_[lr]>", config.hotkey))
-        self._hotkey_keys = set(keyboard.HotKey.parse(config.hotkey))
-        self._pressed_hotkey_keys: set[keyboard.KeyCode | keyboard.Key] = set()
-        self._toggle_mode = config.hotkey == "<cmd>+<shift>"
+        self._normalize_key: Callable[[keyboard.KeyCode | keyboard.Key], keyboard.KeyCode | keyboard.Key] | None = None
+        # Each hotkey key owns one bit; the combo is held when every bit is set.
+        self._hotkey_bits: dict[keyboard.KeyCode | keyboard.Key, int] = {
+            key: 1 << index for index, key in enumerate(dict.fromkeys(keyboard.HotKey.parse(config.hotkey)))
+        }
+        self._hotkey_mask = (1 << len(self._hotkey_bits)) - 1
+        self._pressed_mask = 0
+        self._toggle_mode = config.toggle_mode
         self._hotkey_activated = False
         self._state_lock = threading.Lock()
         self._processing = False
         self._clip_started_at: float | None = None
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._clip_partials: list[str] = []
+        self._chunk_stop: threading.Event | None = None
+        # Long-lived workers drain their queues in order; None asks them to exit.
+        # History writes get their own thread so file I/O never delays the next clip.
+        self._jobs: queue.SimpleQueue[tuple[Callable[..., None], tuple[Any, ...]] | None] = queue.SimpleQueue()
+        self._history_jobs: queue.SimpleQueue[tuple[Callable[..., None], tuple[Any, ...]] | None] = queue.SimpleQueue()
+        self._worker = threading.Thread(
+            target=self._run_jobs,
+            args=(self._jobs,),
+            name="localflow-worker",
+            daemon=True,
+        )
+        self._history_worker = threading.Thread(
+            target=self._run_jobs,
+            args=(self._history_jobs,),
+            name="localflow-history",
+            daemon=True,
+        )
+        self._worker.start()
+        self._history_worker.start()
+
+    def _submit(self, job: Callable[..., None], *args: Any) -> None:
+        self._jobs.put((job, args))
+
+    def _run_jobs(self, jobs: queue.SimpleQueue[tuple[Callable[..., None], tuple[Any, ...]] | None]) -> None:
+        while True:
+            item = jobs.get()
+            if item is None:
+                return
+            job, args = item
+            try:
+                job(*args)
+            except Exception as exc:
+                print(f"[localflow] Error: {exc}")
+
+    @property
+    def transcriber(self) -> WhisperTranscriber:
+        return self._ensure_transcriber()
+
+    def _ensure_transcriber(self) -> WhisperTranscriber:
+        # Built on first use by the worker thread, so the faster-whisper stack is not
+        # imported or loaded before the listener is up. Construction runs the warmup.
+        if self._transcriber is None:
+            from localflow.transcribe import WhisperTranscriber
+
+            self._transcriber = WhisperTranscriber(
+                model_name=self.config.whisper_model,
+                compute_type=self.config.whisper_compute_type,
+                cpu_threads=self.config.whisper_cpu_threads,
+                num_workers=self.config.whisper_num_workers,
+                language=self.config.language,
+                sample_rate=self.config.sample_rate,
+            )
+        return self._transcriber
 
     def _on_press(self, key: keyboard.KeyCode | keyboard.Key) -> None:
-        if self._listener is None:
+        if self._normalize_key is None:
             return
-        normalized = self._normalize_listener_key(key)
-        if normalized not in self._hotkey_keys:
+        normalized = self._normalize_key(key)
+        bit = self._hotkey_bits.get(normalized)
+        if bit is None:
             return
         with self._state_lock:
-            self._pressed_hotkey_keys.add(normalized)
-            if self._pressed_hotkey_keys == self._hotkey_keys:
+            self._pressed_mask |= bit
+            if self._pressed_mask == self._hotkey_mask:
                 if self._hotkey_activated:
                     return
                 self._hotkey_activated = True
@@ -60,40 +127,93 @@ class LocalFlowApp:
                     if self.recorder.recording:
                         self._finish_recording_locked()
                     else:
-                        self.recorder.start()
-                        self._clip_started_at = time.monotonic()
-                        print("[localflow] Recording...")
+                        self._start_recording_locked()
                     return
                 if not self.recorder.recording:
-                    self.recorder.start()
-                    self._clip_started_at = time.monotonic()
-                    print("[localflow] Recording...")
+                    self._start_recording_locked()
 
     def _on_release(self, key: keyboard.KeyCode | keyboard.Key) -> None:
-        if self._listener is None:
+        if self._normalize_key is None:
             return
-        normalized = self._normalize_listener_key(key)
+        normalized = self._normalize_key(key)
         with self._state_lock:
-            self._pressed_hotkey_keys.discard(normalized)
-            if self._pressed_hotkey_keys != self._hotkey_keys:
+            self._pressed_mask &= ~self._hotkey_bits.get(normalized, 0)
+            if self._pressed_mask != self._hotkey_mask:
                 self._hotkey_activated = False
             if self._toggle_mode:
                 return
             if self._processing or not self.recorder.recording:
                 return
-            if self._pressed_hotkey_keys == self._hotkey_keys:
+            if self._pressed_mask == self._hotkey_mask:
                 return
             self._finish_recording_locked()
 
-    def _normalize_listener_key(self, key: keyboard.KeyCode | keyboard.Key) -> keyboard.KeyCode | keyboard.Key:
-        if self._listener is None:
-            return key
-        if self._side_specific_hotkey and isinstance(key, keyboard.Key) and key.value.vk is not None:
-            # Preserve right/left modifier identity for combos like <cmd_r>+<shift_r>.
-            return keyboard.KeyCode.from_vk(key.value.vk)
-        return self._listener.canonical(key)
+    def _key_normalizer(
+        self, listener: keyboard.Listener
+    ) -> Callable[[keyboard.KeyCode | keyboard.Key], keyboard.KeyCode | keyboard.Key]:
+        from pynput import keyboard
+
+        canonical = listener.canonical
+        if not self.config.side_specific_hotkey:
+            return canonical
+
+        def normalize(key: keyboard.KeyCode | keyboard.Key) -> keyboard.KeyCode | keyboard.Key:
+            if isinstance(key, keyboard.Key) and key.value.vk is not None:
+                # Preserve right/left modifier identity for combos like <cmd_r>+<shift_r>.
+                return keyboard.KeyCode.from_vk(key.value.vk)
+            return canonical(key)
+
+        return normalize
+
+    def _start_recording_locked(self) -> None:
+        self.recorder.start()
+        self._clip_started_at = time.monotonic()
+        self._clip_partials = []
+        if self.config.stream_chunk_seconds > 0:
+            self._chunk_stop = threading.Event()
+            threading.Thread(
+                target=self._stream_chunks,
+                args=(self._chunk_stop, self._clip_partials),
+                daemon=True,
+            ).start()
+        print("[localflow] Recording...")
+
+    def _stop_streaming_locked(self) -> None:
+        if self._chunk_stop is not None:
+            self._chunk_stop.set()
+            self._chunk_stop = None
+
+    def _stream_chunks(self, stop: threading.Event, partials: list[str]) -> None:
+        # At least a second per chunk: shorter pieces give Whisper too little context.
+        min_samples = max(
+            self.config.sample_rate,
+            int(self.config.stream_chunk_seconds * self.config.sample_rate),
+        )
+        while not stop.wait(_CHUNK_POLL_SECONDS):
+            # Popping and submitting under the state lock keeps every chunk job queued
+            # ahead of the final job that _finish_recording_locked submits.
+            with self._state_lock:
+                if stop.is_set():
+                    return
+                chunk = self.recorder.pop_chunk(min_samples)
+                if chunk is not None:
+                    self._submit(self._transcribe_chunk, chunk, partials)
+
+    def _transcribe_chunk(self, chunk: np.ndarray, partials: list[str]) -> None:
+        try:
+            text = self.transcriber.transcribe(
+                chunk,
+                language=self.config.language,
+                initial_prompt=partials[-1] if partials else None,
+            )
+        except Exception as exc:
+            print(f"[localflow] Error: {exc}")
+            return
+        if text:
+            partials.append(text)
 
     def _finish_recording_locked(self) -> None:
+        self._stop_streaming_locked()
         audio, duration = self.recorder.stop()
         clip_started_at = self._clip_started_at
         self._clip_started_at = None
@@ -102,11 +222,22 @@ class LocalFlowApp:
             return
         self._processing = True
         print(f"[localflow] Processing {duration:.1f}s clip...")
-        self._executor.submit(self._process_audio, audio, clip_started_at)
+        self._submit(
+            self._process_audio,
+            self.recorder.pop_remaining(),
+            self._clip_partials,
+            clip_started_at,
+        )
 
-    def _process_audio(self, audio, clip_started_at: float | None) -> None:
+    def _process_audio(self, tail: np.ndarray, partials: list[str], clip_started_at: float | None) -> None:
         try:
-            raw_text = self.transcriber.transcribe(audio, language=self.config.language)
+            # Chunk jobs for this clip ran before this one, so partials is complete.
+            tail_text = self.transcriber.transcribe(
+                tail,
+                language=self.config.language,
+                initial_prompt=partials[-1] if partials else None,
+            )
+            raw_text = " ".join(part for part in (*partials, tail_text) if part)
             text = raw_text
             if self.config.enable_voice_commands:
                 text = apply_voice_commands(text)
@@ -118,18 +249,19 @@ class LocalFlowApp:
                 enhancer_elapsed = max(0.0, time.monotonic() - enhancer_started_at)
 
             if text:
+                # Paste first: logging and history are not on the user-visible path.
+                emit_text(text, auto_paste=self.config.auto_paste, paste_mode=self.config.paste_mode)
+                total_elapsed = None if clip_started_at is None else max(0.0, time.monotonic() - clip_started_at)
                 history_mode = "post-enhancer" if self.config.enable_enhancer else "pre-enhancer"
                 history_text = text if self.config.enable_enhancer else pre_enhancer_text
+                self._history_jobs.put((append_history, (history_text, history_mode)))
                 print(f"[localflow] Before enhancer: {pre_enhancer_text}")
                 if self.config.enable_enhancer:
                     print(f"[localflow] After enhancer: {text}")
                 if enhancer_elapsed is not None:
                     print(f"[localflow] Enhancer time: {enhancer_elapsed:.2f}s")
-                append_history(history_text, mode=history_mode)
-                emit_text(text, auto_paste=self.config.auto_paste, paste_mode=self.config.paste_mode)
                 print(f"[localflow] {text}")
-                if clip_started_at is not None:
-                    total_elapsed = max(0.0, time.monotonic() - clip_started_at)
+                if total_elapsed is not None:
                     print(f"[localflow] Start->text time: {total_elapsed:.2f}s")
             else:
                 print("[localflow] No speech detected.")
@@ -139,6 +271,16 @@ class LocalFlowApp:
             with self._state_lock:
                 self._processing = False
 
+    def _warm_up(self) -> None:
+        try:
+            self._ensure_transcriber()
+            if self.config.enable_enhancer:
+                self.enhancer.warmup()
+            if self.config.auto_paste:
+                preload_paste_backend()
+        except Exception as exc:
+            print(f"[localflow] Warmup failed: {exc}")
+
     def start_hotkey_listener(self, announce: bool = True) -> None:
         if self._listener is not None and self._listener.is_alive():
             return
@@ -152,8 +294,15 @@ class LocalFlowApp:
             else:
                 print("[localflow] Hold hotkey to record, release to process.")
             print("[localflow] Press Ctrl+C to exit.")
-        self._listener = keyboard.Listener(on_press=self._on_press, on_release=self._on_release)
-        self._listener.start()
+        from pynput import keyboard
+
+        listener = keyboard.Listener(on_press=self._on_press, on_release=self._on_release)
+        self._normalize_key = self._key_normalizer(listener)
+        self._listener = listener
+        listener.start()
+        # Runs ahead of the first clip on the single worker, so that clip waits for
+        # the model only if the hotkey is pressed before warmup finishes.
+        self._submit(self._warm_up)
 
     def run(self) -> None:
         self.start_hotkey_listener(announce=True)
@@ -167,10 +316,16 @@ class LocalFlowApp:
             self.stop()
 
     def stop(self) -> None:
+        with self._state_lock:
+            self._stop_streaming_locked()
         if self.recorder.recording:
             self.recorder.stop()
             self._clip_started_at = None
         if self._listener is not None:
             self._listener.stop()
             self._listener = None
-        self._executor.shutdown(wait=False, cancel_futures=True)
+            self._normalize_key = None
+        self._jobs.put(None)
+        self._history_jobs.put(None)
+        self._worker.join(timeout=_WORKER_JOIN_TIMEOUT_SECONDS)
+        self._history_worker.join(timeout=_WORKER_JOIN_TIMEOUT_SECONDS)
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-import threading
 import time
+from typing import TYPE_CHECKING
 
 import numpy as np
-import sounddevice as sd
+
+if TYPE_CHECKING:
+    import sounddevice as sd
+
+# Enough for a five-minute clip; np.empty only reserves the pages, they are
+# committed as the recording fills them.
+_PREALLOCATED_SECONDS = 300
+# pop_chunk() cuts at the quietest 10 ms frame of the last half second it hands out.
+_SPLIT_SEARCH_SECONDS = 0.5
+_SPLIT_FRAME_SECONDS = 0.01
 
 
 @dataclass
@@ -13,25 +22,41 @@ class AudioRecorder:
     sample_rate: int = 16000
     channels: int = 1
     blocksize: int = 1024
-    dtype: str = "float32"
-    _frames: list[np.ndarray] = field(default_factory=list)
+    # PortAudio's native 16-bit PCM: half the bytes of float32 per sample, and
+    # WhisperTranscriber converts to float32 itself.
+    dtype: str = "int16"
+    _buffer: np.ndarray = field(init=False, repr=False)
+    _write: int = 0
+    _read: int = 0
     _stream: sd.InputStream | None = None
-    _lock: threading.Lock = field(default_factory=threading.Lock)
     _started_at: float | None = None
 
+    def __post_init__(self) -> None:
+        self._buffer = np.empty(self.sample_rate * _PREALLOCATED_SECONDS, dtype=self.dtype)
+
     @property
     def recording(self) -> bool:
         return self._stream is not None
 
     def _callback(self, indata, _frames, _time, _status) -> None:
-        with self._lock:
-            self._frames.append(indata.copy())
+        # Single producer: only the PortAudio thread writes here, and readers only
+        # look at the buffer once stop() has halted the stream, so no lock is needed.
+        start = self._write
+        end = start + indata.shape[0]
+        if end > self._buffer.size:
+            grown = np.empty(max(end, self._buffer.size * 2), dtype=self._buffer.dtype)
+            grown[:start] = self._buffer[:start]
+            self._buffer = grown
+        self._buffer[start:end] = indata[:, 0]
+        self._write = end
 
     def start(self) -> None:
         if self._stream is not None:
             return
-        with self._lock:
-            self._frames.clear()
+        import sounddevice as sd
+
+        self._write = 0
+        self._read = 0
         self._started_at = time.monotonic()
         self._stream = sd.InputStream(
             samplerate=self.sample_rate,
@@ -49,17 +74,44 @@ class AudioRecorder:
         self._started_at = None
 
         if stream is None:
-            return np.array([], dtype=np.float32), 0.0
+            return self._buffer[:0], 0.0
 
         stream.stop()
         stream.close()
 
-        with self._lock:
-            if not self._frames:
-                return np.array([], dtype=np.float32), 0.0
-            audio = np.concatenate(self._frames, axis=0).reshape(-1).astype(np.float32)
-            self._frames.clear()
+        if self._write == 0:
+            return self._buffer[:0], 0.0
+        # Zero-copy view; it stays valid until the next start() reuses the buffer.
+        audio = self._buffer[: self._write]
 
         duration = 0.0 if started_at is None else max(0.0, time.monotonic() - started_at)
         return audio, duration
 
+    def pop_chunk(self, min_samples: int) -> np.ndarray | None:
+        # Consumer side while recording: audio captured since the last pop, as a view.
+        # _write is read before _buffer, and a grow in the callback copies everything
+        # below the old cursor, so [start:end] is complete in whichever buffer we see.
+        start = self._read
+        end = self._write
+        buffer = self._buffer
+        if end - start < max(1, min_samples):
+            return None
+        end = self._quietest_split(buffer, start, end)
+        self._read = end
+        return buffer[start:end]
+
+    def pop_remaining(self) -> np.ndarray:
+        start = self._read
+        end = self._write
+        self._read = end
+        return self._buffer[start:end]
+
+    def _quietest_split(self, buffer: np.ndarray, start: int, end: int) -> int:
+        frame = max(1, int(self.sample_rate * _SPLIT_FRAME_SECONDS))
+        frames = min(int(self.sample_rate * _SPLIT_SEARCH_SECONDS), (end - start) // 2) // frame
+        if frames < 2:
+            return end
+        window_start = end - frames * frame
+        window = buffer[window_start:end].astype(np.float32).reshape(frames, frame)
+        quietest = int(np.argmin(np.square(window).sum(axis=1)))
+        return window_start + quietest * frame + frame // 2
@@ -51,12 +51,16 @@ def command_check(config_path: Path | None) -> int:
     print(f"Config path: {config_path or default_config_path()}")
     print(f"Hotkey: {config.hotkey}")
     print(f"Whisper model: {config.whisper_model}")
+    print(f"Whisper compute type: {config.whisper_compute_type}")
+    print(f"Whisper CPU threads: {config.whisper_cpu_threads or '(auto)'}")
+    print(f"Whisper workers: {config.whisper_num_workers}")
     print(f"Language: {config.language}")
     print(f"Auto paste: {config.auto_paste}")
     print(f"Paste mode: {config.paste_mode}")
     print(f"Voice commands: {config.enable_voice_commands}")
     print(f"Enhancer enabled: {config.enable_enhancer}")
     print(f"Enhancer model path: {config.enhancer_model_path or '(not set)'}")
+    print(f"Stream chunk seconds: {config.stream_chunk_seconds or '(disabled)'}")
     return 0
 
 
@@ -2,18 +2,28 @@ from __future__ import annotations
 
 import re
 
+_COMMAND_TOKENS = {
+    "new paragraph": "\n\n",
+    "new line": "\n",
+}
+# One pass: spoken commands (with the blanks around them) and existing line
+# breaks (with their surrounding blanks) are both rewritten by _replace_match.
+_COMMAND_PATTERN = re.compile(r"[ \t]*\b(new paragraph|new line)\b[ \t]*|[ \t]*\n[ \t]*", re.IGNORECASE)
+
+
+def _replace_match(match: re.Match[str]) -> str:
+    spoken = match.group(1)
+    if spoken is None:
+        return "\n"
+    return _COMMAND_TOKENS[spoken.lower()]
+
 
 def apply_voice_commands(text: str) -> str:
     cleaned = text.strip()
     if not cleaned:
         return ""
-
-    replacements = (
-        ("new paragraph", "\n\n"),
-        ("new line", "\n"),
-    )
-    for spoken, token in replacements:
-        cleaned = re.sub(rf"\b{re.escape(spoken)}\b", token, cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"[ \t]*\n[ \t]*", "\n", cleaned)
-    return cleaned.strip()
-
+    # Most clips contain neither a line break nor a spoken command; two substring
+    # scans are cheaper than entering the regex engine and its callback.
+    if "\n" not in cleaned and "new " not in cleaned.lower():
+        return cleaned
+    return _COMMAND_PATTERN.sub(_replace_match, cleaned).strip()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 import re
 
@@ -20,8 +20,63 @@ enable_voice_commands = true
 enable_enhancer = false
 enhancer_model_path = ""
 enhancer_temperature = 0.1
+stream_chunk_seconds = 2.0 # 0 transcribes only after recording stops
+whisper_compute_type = "int8"
+whisper_cpu_threads = 0 # 0 picks min(4, CPU cores)
+whisper_num_workers = 1
 """
 
+_SIDE_SPECIFIC_HOTKEY = re.compile(r"<(?:cmd|ctrl|shift|alt)_[lr]>")
+_TOGGLE_HOTKEY = "<cmd>+<shift>"
+_ENABLE_ENHANCER_LINE = re.compile(r"(?m)^(\s*enable_enhancer\s*=\s*)(?:true|false|[^\n#]+)(\s*(?:#.*)?)$")
+# Backward compatibility for older config examples.
+_HOTKEY_REPLACEMENTS = (
+    ("+space", "+<space>"),
+    ("+ Space", "+<space>"),
+    ("+SPACE", "+<space>"),
+)
+_HOTKEY_ALIASES = {
+    **dict.fromkeys(("cmd_r", "right_cmd", "right command", "right-command"), "<cmd_r>"),
+    **dict.fromkeys(
+        (
+            "cmd+shift",
+            "cmd + shift",
+            "command+shift",
+            "command + shift",
+            "<cmd>+shift",
+            "<cmd>+<shift>",
+            "cmd+<shift>",
+            "cmd_r+space",
+            "cmd_r+<space>",
+            "cmd_r + space",
+            "right command + space",
+            "right-command+space",
+            "<cmd_r>+space",
+            "<cmd_r>+<space>",
+        ),
+        _TOGGLE_HOTKEY,
+    ),
+    **dict.fromkeys(
+        (
+            "cmd_r+shift_r",
+            "right command + right shift",
+            "right-command+right-shift",
+            "<cmd_r>+<shift_r>",
+            "<cmd_r>+<shift>",
+            "<cmd_r>+shift_r",
+        ),
+        "<cmd_r>",
+    ),
+}
+# Fallback for Python < 3.11: one `key = value` per line, the value's type picked by
+# whichever group matches, trailing `# comment` ignored.
+_FLAT_TOML_LINE = re.compile(
+    r"""^[ \t]*([A-Za-z_][\w-]*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|((?i:true|false))|(-?\d+\.\d+)|(-?\d+)|([^#\n]*?))"""
+    r"""[ \t]*(?:#.*)?$""",
+    re.MULTILINE,
+)
+
 
 @dataclass
 class FlowConfig:
@@ -35,6 +90,17 @@ class FlowConfig:
     enable_enhancer: bool
     enhancer_model_path: str
     enhancer_temperature: float
+    stream_chunk_seconds: float
+    whisper_compute_type: str
+    whisper_cpu_threads: int | None
+    whisper_num_workers: int
+    side_specific_hotkey: bool = field(init=False)
+    toggle_mode: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Derived once at load time so the key listener never re-inspects the hotkey string.
+        self.side_specific_hotkey = bool(_SIDE_SPECIFIC_HOTKEY.search(self.hotkey))
+        self.toggle_mode = self.hotkey == _TOGGLE_HOTKEY
 
 
 def app_support_directory() -> Path:
@@ -64,14 +130,17 @@ def ensure_default_config(path: Path | None = None, overwrite: bool = False) ->
 def set_enable_enhancer(enabled: bool, path: Path | None = None) -> Path:
     target = ensure_default_config(path)
     value = "true" if enabled else "false"
-    content = target.read_text(encoding="utf-8")
-    pattern = r"(?m)^(\s*enable_enhancer\s*=\s*)(?:true|false|[^\n#]+)(\s*(?:#.*)?)$"
-    updated, count = re.subn(pattern, rf"\1{value}\2", content, count=1)
-    if count == 0:
-        if updated and not updated.endswith("\n"):
-            updated += "\n"
-        updated += f"enable_enhancer = {value}\n"
-    target.write_text(updated, encoding="utf-8")
+    with target.open("r+", encoding="utf-8") as handle:
+        content = handle.read()
+        updated, count = _ENABLE_ENHANCER_LINE.subn(rf"\g<1>{value}\g<2>", content, count=1)
+        if count == 0:
+            if updated and not updated.endswith("\n"):
+                updated += "\n"
+            updated += f"enable_enhancer = {value}\n"
+        if updated != content:
+            handle.seek(0)
+            handle.write(updated)
+            handle.truncate()
     return target
 
 
@@ -131,6 +200,11 @@ def load_config(path: Path | None = None) -> FlowConfig:
     enable_enhancer = _as_bool(data.get("enable_enhancer", False), False)
     enhancer_model_path = str(data.get("enhancer_model_path", "")).strip()
     enhancer_temperature = _as_float(data.get("enhancer_temperature", 0.1), 0.1)
+    stream_chunk_seconds = max(0.0, _as_float(data.get("stream_chunk_seconds", 2.0), 2.0))
+    whisper_compute_type = str(data.get("whisper_compute_type", "int8")).strip() or "int8"
+    # 0 (or anything below 1) leaves the thread count to WhisperTranscriber's default.
+    whisper_cpu_threads = _as_int(data.get("whisper_cpu_threads", 0), 0)
+    whisper_num_workers = max(1, _as_int(data.get("whisper_num_workers", 1), 1))
 
     return FlowConfig(
         hotkey=hotkey,
@@ -143,6 +217,10 @@ def load_config(path: Path | None = None) -> FlowConfig:
         enable_enhancer=enable_enhancer,
         enhancer_model_path=enhancer_model_path,
         enhancer_temperature=enhancer_temperature,
+        stream_chunk_seconds=stream_chunk_seconds,
+        whisper_compute_type=whisper_compute_type,
+        whisper_cpu_threads=whisper_cpu_threads if whisper_cpu_threads > 0 else None,
+        whisper_num_workers=whisper_num_workers,
     )
 
 
@@ -154,72 +232,25 @@ def _parse_config_text(text: str) -> dict[str, object]:
 
 def _parse_flat_toml_like(text: str) -> dict[str, object]:
     parsed: dict[str, object] = {}
-    for raw_line in text.splitlines():
-        line = raw_line.split("#", 1)[0].strip()
-        if not line or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip()
-        parsed[key] = _parse_scalar(value)
+    for match in _FLAT_TOML_LINE.finditer(text):
+        key, double_quoted, single_quoted, boolean, floating, integer, bare = match.groups()
+        if double_quoted is not None:
+            parsed[key] = double_quoted
+        elif single_quoted is not None:
+            parsed[key] = single_quoted
+        elif boolean is not None:
+            parsed[key] = boolean.lower() == "true"
+        elif floating is not None:
+            parsed[key] = float(floating)
+        elif integer is not None:
+            parsed[key] = int(integer)
+        else:
+            parsed[key] = bare or ""
     return parsed
 
 
-def _parse_scalar(value: str) -> object:
-    if not value:
-        return ""
-    if value.startswith('"') and value.endswith('"') and len(value) >= 2:
-        return value[1:-1]
-    if value.startswith("'") and value.endswith("'") and len(value) >= 2:
-        return value[1:-1]
-
-    lowered = value.lower()
-    if lowered in {"true", "false"}:
-        return lowered == "true"
-
-    try:
-        return int(value)
-    except ValueError:
-        pass
-    try:
-        return float(value)
-    except ValueError:
-        pass
-    return value
-
-
 def _normalize_hotkey(hotkey: str) -> str:
     normalized = hotkey.strip()
-    # Backward compatibility for older config examples.
-    normalized = normalized.replace("+space", "+<space>")
-    normalized = normalized.replace("+ Space", "+<space>")
-    normalized = normalized.replace("+SPACE", "+<space>")
-    if normalized in {"cmd_r", "right_cmd", "right command", "right-command"}:
-        return "<cmd_r>"
-    if normalized in {
-        "cmd+shift",
-        "cmd + shift",
-        "command+shift",
-        "command + shift",
-        "<cmd>+shift",
-        "<cmd>+<shift>",
-        "cmd+<shift>",
-        "cmd_r+space",
-        "cmd_r+<space>",
-        "cmd_r + space",
-        "right command + space",
-        "right-command+space",
-        "<cmd_r>+space",
-        "<cmd_r>+<space>",
-    }:
-        return "<cmd>+<shift>"
-    if normalized in {
-        "cmd_r+shift_r",
-        "right command + right shift",
-        "right-command+right-shift",
-        "<cmd_r>+<shift_r>",
-        "<cmd_r>+<shift>",
-        "<cmd_r>+shift_r",
-    }:
-        return "<cmd_r>"
-    return normalized
+    for old, new in _HOTKEY_REPLACEMENTS:
+        normalized = normalized.replace(old, new)
+    return _HOTKEY_ALIASES.get(normalized, normalized)
@@ -1,7 +1,36 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import os
+import re
+
+# Inputs shorter than this are single words or fragments the model has nothing to fix.
+_MIN_ENHANCE_CHARS = 12
+# Longer than this with no punctuation at all reads as a run-on the model should split.
+_MAX_UNPUNCTUATED_CHARS = 30
+_REPEATED_SPACES = re.compile(r" {2,}")
+_LOWERCASE_WORD = re.compile(r"\b[a-z]+\b")
+_WORD = re.compile(r"[A-Za-z']+")
+_VOWELS = frozenset("aeiouy")
+_PUNCTUATION = frozenset(",;:.!?")
+# Context window for the rewrite model. Going from 2048 to 1024 halves the KV cache and
+# still fits dictations of several hundred words. Anything longer is returned unchanged;
+# see _run_completion.
+_CONTEXT_TOKENS = 1024
+# The first word, after any opening quotes or brackets.
+_LEADING_WORD = re.compile(r"""["'(\[{\u201c\u2018]*(\S*)""")
+# Identical leading text on every call: llama.cpp keeps the KV cache for the longest
+# prompt prefix shared with the previous call, so only the utterance is evaluated.
+_PROMPT_PREFIX = (
+    "You clean raw speech-to-text output.\n"
+    "Rules:\n"
+    "- Preserve meaning.\n"
+    "- Keep wording close to the original.\n"
+    "- Fix punctuation, capitalization, and obvious transcription mistakes.\n"
+    "- Return only cleaned text.\n\n"
+    "Input:\n"
+)
 
 
 class LocalEnhancer:
@@ -11,6 +40,7 @@ class LocalEnhancer:
         self.temperature = temperature
         self._model = None
         self._error: str | None = None
+        self._complete = lru_cache(maxsize=64)(self._run_completion)
         if self.enabled:
             self._load()
 
@@ -39,35 +69,85 @@ class LocalEnhancer:
             return
 
         threads = max(1, (os.cpu_count() or 2) - 1)
+        # n_gpu_layers=-1 offloads every layer to Metal on Apple Silicon builds;
+        # CPU-only builds ignore it.
         self._model = Llama(
             model_path=str(model_file),
-            n_ctx=2048,
+            n_ctx=_CONTEXT_TOKENS,
+            n_batch=512,
             n_threads=threads,
+            n_gpu_layers=-1,
+            use_mmap=True,
+            use_mlock=False,
+            logits_all=False,
             verbose=False,
         )
 
+    def warmup(self) -> None:
+        if self._model is None:
+            return
+        # A one-token completion maps the weights in and evaluates the prompt preamble.
+        self._model.create_completion(prompt=_build_prompt("warmup."), max_tokens=1, temperature=0.0)
+
     def enhance(self, text: str) -> str:
         if not text.strip() or self._model is None:
             return text
+        # Rules first: most Whisper output only needs a capital and a full stop, and
+        # llama.cpp is reserved for text that looks mistranscribed.
+        cleaned = _quick_clean(text)
+        if len(cleaned) < _MIN_ENHANCE_CHARS or not _looks_mistranscribed(cleaned):
+            return cleaned
+        return self._complete(cleaned)
 
-        prompt = (
-            "You clean raw speech-to-text output.\n"
-            "Rules:\n"
-            "- Preserve meaning.\n"
-            "- Keep wording close to the original.\n"
-            "- Fix punctuation, capitalization, and obvious transcription mistakes.\n"
-            "- Return only cleaned text.\n\n"
-            f"Input:\n{text}\n\n"
-            "Cleaned:"
-        )
-        max_tokens = max(64, min(256, len(text) * 2))
+    def _run_completion(self, text: str) -> str:
+        prompt = _build_prompt(text)
+        # Cleaned text is about as long as its input, roughly 1.3 tokens per word.
+        max_tokens = min(len(text.split()) * 3 + 16, 200)
+        # llama.cpp raises once prompt and output outgrow the context. A long dictation
+        # should still be pasted, so skip the rewrite for it.
+        if len(self._model.tokenize(prompt.encode("utf-8"))) + max_tokens > _CONTEXT_TOKENS:
+            return text
         completion = self._model.create_completion(
             prompt=prompt,
             max_tokens=max_tokens,
             temperature=self.temperature,
             top_p=0.9,
+            top_k=20,
+            repeat_penalty=1.0,
             stop=["\n\nInput:", "\n\nRules:"],
         )
-        generated = completion["choices"][0]["text"].strip()
+        choice = completion["choices"][0]
+        if choice.get("finish_reason") == "length":
+            # Cut off mid-output; the raw transcript beats a truncated rewrite.
+            return text
+        generated = choice["text"].strip()
         return generated or text
 
+
+def _build_prompt(text: str) -> str:
+    return f"{_PROMPT_PREFIX}{text}\n\nCleaned:"
+
+
+def _quick_clean(text: str) -> str:
+    cleaned = _REPEATED_SPACES.sub(" ", text.strip())
+    match = _LEADING_WORD.match(cleaned)
+    word = match.group(1)
+    # Only an all-lowercase first word is capitalized: "3pm" or "iPhone" stay as they are.
+    if word[:1].islower() and word == word.lower():
+        start = match.start(1)
+        cleaned = f"{cleaned[:start]}{word[0].upper()}{cleaned[start + 1:]}"
+    if cleaned and cleaned[-1].isalnum():
+        cleaned += "."
+    return cleaned
+
+
+def _looks_mistranscribed(text: str) -> bool:
+    words = [word.lower() for word in _WORD.findall(text)]
+    bigrams = list(zip(words, words[1:]))
+    # Stutters ("the the") and repeated phrases are typical Whisper glitches.
+    if len(bigrams) != len(set(bigrams)) or any(first == second for first, second in bigrams):
+        return True
+    # Lowercase only, so acronyms like "NBC" are not mistaken for garbled words.
+    if any(len(word) > 2 and _VOWELS.isdisjoint(word) for word in _LOWERCASE_WORD.findall(text)):
+        return True
+    return len(text) > _MAX_UNPUNCTUATED_CHARS and _PUNCTUATION.isdisjoint(text[:-1])
@@ -1,12 +1,43 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+import os
 from pathlib import Path
 import tkinter as tk
+from tkinter import ttk
+from typing import Callable
 
 from localflow.config import history_file_path
 from localflow.history import HistoryEntry, read_recent_history
 
+try:
+    from watchdog.observers import Observer
+except Exception:
+    Observer = None
+
+_HISTORY_LIMIT = 10
+# Row colors per history mode as (background, foreground); other modes keep the default style.
+_MODE_STYLES = {"post-enhancer": ("#dbeafe", "#1e3a8a")}
+_POLL_INTERVAL_MS = 2000
+_TIMESTAMP_CACHE_SIZE = 256
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+# With a file watcher running, polling is only a safety net for missed events.
+_WATCHED_POLL_INTERVAL_MS = 30000
+
+
+class _HistoryChangeHandler:
+    # watchdog only calls dispatch(), so this does not need its FileSystemEventHandler base.
+    def __init__(self, filename: str, on_change: Callable[[], None]) -> None:
+        self.filename = filename
+        self.on_change = on_change
+
+    def dispatch(self, event) -> None:
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path and os.path.basename(os.fsdecode(path)) == self.filename:
+                self.on_change()
+                return
+
 
 class LocalFlowGUI:
     def __init__(self, _config_path: Path | None = None) -> None:
@@ -18,11 +49,57 @@ class LocalFlowGUI:
         self.root.configure(bg="#edf2f7")
 
         self.status_text = tk.StringVar(value="Ready.")
+        self._rendered_key: tuple[tuple[str, str, str], ...] | None = None
+        # History reads run here so a slow disk never stalls the Tk event loop.
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        self._refresh_pending = False
+        # Requests made while a read is in flight collapse into one follow-up read.
+        self._refresh_again = False
+        self._refresh_again_reports_errors = False
+        self._closed = False
+        self._timestamp_labels: dict[str, str] = {}
+        # Full text per Treeview row id; rows show it flattened to one line.
+        self._row_texts: dict[str, str] = {}
 
         self._build_layout()
-        self.refresh_from_disk()
+        # Deferred until mainloop runs, which the worker's after() call requires.
+        self.root.after(0, self.refresh_from_disk)
+        self._observer = self._start_watcher()
         self._schedule_refresh()
-        self.root.protocol("WM_DELETE_WINDOW", self.root.destroy)
+        self.root.protocol("WM_DELETE_WINDOW", self._close)
+
+    def _start_watcher(self) -> Observer | None:
+        if Observer is None:
+            return None
+        handler = _HistoryChangeHandler(self.history_path.name, self._on_history_changed)
+        try:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+            observer = Observer()
+            observer.schedule(handler, str(self.history_path.parent), recursive=False)
+            observer.daemon = True
+            observer.start()
+        except Exception:
+            return None
+        return observer
+
+    def _on_history_changed(self) -> None:
+        # Runs on watchdog's thread; after() hands the refresh to the Tk loop. It fails
+        # before mainloop starts or during destroy(), and letting that escape would end
+        # the observer thread. Early events are covered by the initial refresh anyway.
+        if self._closed:
+            return
+        try:
+            self.root.after(0, self._auto_refresh_once)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _close(self) -> None:
+        self._closed = True
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        self._io_executor.shutdown(wait=False)
+        self.root.destroy()
 
     def _build_layout(self) -> None:
         container = tk.Frame(self.root, bg="#edf2f7", padx=18, pady=18)
@@ -73,25 +150,63 @@ class LocalFlowGUI:
         )
         refresh_btn.pack(side=tk.LEFT)
 
-        history_frame = tk.Frame(container, bg="#edf2f7")
-        history_frame.pack(fill=tk.BOTH, expand=True)
-
-        self.history_canvas = tk.Canvas(
-            history_frame,
+        self.empty_label = tk.Label(
+            container,
+            text="No speech history yet.\nRun dictation to populate this view.",
             bg="#edf2f7",
-            highlightthickness=0,
-            borderwidth=0,
+            fg="#64748b",
+            justify=tk.LEFT,
+            font=("Helvetica", 12),
+            padx=4,
+            pady=12,
         )
-        self.history_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        scrollbar = tk.Scrollbar(history_frame, orient=tk.VERTICAL, command=self.history_canvas.yview)
+        self.history_frame = tk.Frame(container, bg="#edf2f7")
+        self.history_frame.pack(fill=tk.BOTH, expand=True)
+
+        style = ttk.Style(self.root)
+        style.configure("History.Treeview", font=("Helvetica", 13), rowheight=30)
+        style.configure("History.Treeview.Heading", font=("Helvetica", 11, "bold"))
+
+        # One native widget for all rows instead of a Frame and three Labels per entry.
+        self.history_tree = ttk.Treeview(
+            self.history_frame,
+            columns=("time", "mode", "text"),
+            show="headings",
+            height=_HISTORY_LIMIT,
+            selectmode="browse",
+            style="History.Treeview",
+        )
+        self.history_tree.heading("time", text="Time", anchor="w")
+        self.history_tree.heading("mode", text="Mode", anchor="w")
+        self.history_tree.heading("text", text="Text", anchor="w")
+        self.history_tree.column("time", width=200, minwidth=160, stretch=False)
+        self.history_tree.column("mode", width=120, minwidth=100, stretch=False)
+        self.history_tree.column("text", width=480, minwidth=200, stretch=True)
+        for mode, (background, foreground) in _MODE_STYLES.items():
+            self.history_tree.tag_configure(mode, background=background, foreground=foreground)
+        self.history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        scrollbar = ttk.Scrollbar(self.history_frame, orient=tk.VERTICAL, command=self.history_tree.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.history_canvas.configure(yscrollcommand=scrollbar.set)
+        self.history_tree.configure(yscrollcommand=scrollbar.set)
+        self.history_tree.bind("<<TreeviewSelect>>", self._show_selected_text)
+        self._showing_empty = False
 
-        self.cards_frame = tk.Frame(self.history_canvas, bg="#edf2f7")
-        self.cards_window = self.history_canvas.create_window((0, 0), window=self.cards_frame, anchor="nw")
-        self.cards_frame.bind("<Configure>", self._on_cards_configure)
-        self.history_canvas.bind("<Configure>", self._on_canvas_configure)
+        # Rows are single-line and clipped, so the selected entry is shown here in full.
+        self.detail_text = tk.Text(
+            container,
+            height=5,
+            wrap=tk.WORD,
+            bg="white",
+            fg="#0f172a",
+            relief=tk.FLAT,
+            padx=10,
+            pady=8,
+            font=("Helvetica", 13),
+        )
+        self.detail_text.pack(fill=tk.X, pady=(8, 0))
+        self._set_detail_text("")
 
         status_label = tk.Label(
             container,
@@ -102,99 +217,106 @@ class LocalFlowGUI:
         )
         status_label.pack(anchor="w", pady=(8, 0))
 
-    def _on_cards_configure(self, _event) -> None:
-        self.history_canvas.configure(scrollregion=self.history_canvas.bbox("all"))
+    def refresh_from_disk(self) -> None:
+        self._request_refresh(report_errors=True)
 
-    def _on_canvas_configure(self, event) -> None:
-        self.history_canvas.itemconfigure(self.cards_window, width=event.width)
+    def _request_refresh(self, report_errors: bool) -> None:
+        if self._closed:
+            return
+        if self._refresh_pending:
+            # The in-flight read may have started before the change that triggered this.
+            self._refresh_again = True
+            self._refresh_again_reports_errors = self._refresh_again_reports_errors or report_errors
+            return
+        self._refresh_pending = True
+        future = self._io_executor.submit(read_recent_history, _HISTORY_LIMIT, self.history_path)
+        future.add_done_callback(lambda done: self._on_refresh_done(done, report_errors))
 
-    def refresh_from_disk(self) -> None:
+    def _on_refresh_done(self, future: Future[list[HistoryEntry]], report_errors: bool) -> None:
+        # Runs on the I/O worker; after() marshals the result back to the Tk thread.
+        if self._closed:
+            return
         try:
-            entries = read_recent_history(limit=10, path=self.history_path)
+            self.root.after(0, self._finish_refresh, future, report_errors)
+        except (RuntimeError, tk.TclError):
+            # Nothing will run _finish_refresh, so free the slot for the next request.
+            self._refresh_pending = False
+
+    def _finish_refresh(self, future: Future[list[HistoryEntry]], report_errors: bool) -> None:
+        self._refresh_pending = False
+        error = future.exception()
+        if error is None:
+            self._apply_entries(future.result())
+        elif report_errors:
+            self._apply_entries([])
+            self.status_text.set(f"Refresh failed: {error}")
+        if self._refresh_again:
+            report_again = self._refresh_again_reports_errors
+            self._refresh_again = False
+            self._refresh_again_reports_errors = False
+            self._request_refresh(report_errors=report_again)
+
+    def _apply_entries(self, entries: list[HistoryEntry]) -> None:
+        # An idle refresh only updates the status line; the rows are left untouched.
+        key = tuple((entry.timestamp, entry.text, entry.mode) for entry in entries)
+        if key != self._rendered_key:
             self._render_entries(entries)
-            self.status_text.set(f"Showing {len(entries)} item(s). Last refresh: {self._now_label()}")
-        except Exception as exc:
-            self.status_text.set(f"Refresh failed: {exc}")
-            self._render_entries([])
+            self._rendered_key = key
+        self.status_text.set(f"Showing {len(entries)} item(s). Last refresh: {self._now_label()}")
 
     def _render_entries(self, entries: list[HistoryEntry]) -> None:
-        for child in self.cards_frame.winfo_children():
-            child.destroy()
-
-        if not entries:
-            empty = tk.Label(
-                self.cards_frame,
-                text="No speech history yet.\nRun dictation to populate this view.",
-                bg="#edf2f7",
-                fg="#64748b",
-                justify=tk.LEFT,
-                font=("Helvetica", 12),
-                padx=4,
-                pady=12,
-            )
-            empty.pack(anchor="w")
-            return
-
+        self.history_tree.delete(*self.history_tree.get_children())
+        self._row_texts.clear()
         for entry in entries:
-            card = tk.Frame(self.cards_frame, bg="white", bd=1, relief=tk.SOLID, padx=12, pady=10)
-            card.pack(fill=tk.X, pady=(0, 10))
-
-            top = tk.Frame(card, bg="white")
-            top.pack(fill=tk.X)
-
-            timestamp_label = tk.Label(
-                top,
-                text=self._format_timestamp(entry.timestamp),
-                bg="white",
-                fg="#0f172a",
-                font=("Helvetica", 11, "bold"),
-            )
-            timestamp_label.pack(side=tk.LEFT)
-
-            mode_label = tk.Label(
-                top,
-                text=entry.mode,
-                bg="#dbeafe" if entry.mode == "post-enhancer" else "#e2e8f0",
-                fg="#1e3a8a" if entry.mode == "post-enhancer" else "#334155",
-                font=("Helvetica", 10, "bold"),
-                padx=8,
-                pady=2,
+            row = self.history_tree.insert(
+                "",
+                tk.END,
+                values=(self._format_timestamp(entry.timestamp), entry.mode, entry.text.replace("\n", " ")),
+                tags=(entry.mode,),
             )
-            mode_label.pack(side=tk.RIGHT)
-
-            text_label = tk.Label(
-                card,
-                text=entry.text,
-                bg="white",
-                fg="#111827",
-                justify=tk.LEFT,
-                anchor="w",
-                wraplength=760,
-                font=("Helvetica", 13),
-                pady=8,
-            )
-            text_label.pack(fill=tk.X)
+            self._row_texts[row] = entry.text
+        self._show_selected_text()
+
+        if not entries and not self._showing_empty:
+            self.empty_label.pack(anchor="w", before=self.history_frame)
+        elif entries and self._showing_empty:
+            self.empty_label.pack_forget()
+        self._showing_empty = not entries
+
+    def _show_selected_text(self, _event: tk.Event | None = None) -> None:
+        selection = self.history_tree.selection()
+        self._set_detail_text(self._row_texts.get(selection[0], "") if selection else "")
+
+    def _set_detail_text(self, text: str) -> None:
+        self.detail_text.configure(state=tk.NORMAL)
+        self.detail_text.delete("1.0", tk.END)
+        if text:
+            self.detail_text.insert("1.0", text)
+            self.detail_text.configure(fg="#0f172a")
+        else:
+            self.detail_text.insert("1.0", "Select an entry to see its full text.")
+            self.detail_text.configure(fg="#64748b")
+        self.detail_text.configure(state=tk.DISABLED)
 
     def _schedule_refresh(self) -> None:
-        self.root.after(2000, self._auto_refresh)
+        interval = _POLL_INTERVAL_MS if self._observer is None else _WATCHED_POLL_INTERVAL_MS
+        self.root.after(interval, self._auto_refresh)
 
     def _auto_refresh(self) -> None:
-        try:
-            entries = read_recent_history(limit=10, path=self.history_path)
-            self._render_entries(entries)
-            self.status_text.set(f"Showing {len(entries)} item(s). Last refresh: {self._now_label()}")
-        except Exception:
-            pass
+        self._auto_refresh_once()
         self._schedule_refresh()
 
+    def _auto_refresh_once(self) -> None:
+        self._request_refresh(report_errors=False)
+
     def _format_timestamp(self, timestamp: str) -> str:
-        if not timestamp:
-            return "Unknown time"
-        try:
-            dt = datetime.fromisoformat(timestamp)
-            return dt.strftime("%b %d, %Y %I:%M:%S %p")
-        except ValueError:
-            return timestamp
+        # The same few timestamps come back on every refresh, so format each only once.
+        label = self._timestamp_labels.get(timestamp)
+        if label is None:
+            if len(self._timestamp_labels) >= _TIMESTAMP_CACHE_SIZE:
+                self._timestamp_labels.clear()
+            label = self._timestamp_labels[timestamp] = _format_timestamp(timestamp)
+        return label
 
     def _now_label(self) -> str:
         return datetime.now().strftime("%I:%M:%S %p")
@@ -203,5 +325,18 @@ class LocalFlowGUI:
         self.root.mainloop()
 
 
+def _format_timestamp(timestamp: str) -> str:
+    if not timestamp:
+        return "Unknown time"
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return timestamp
+    # Same output as strftime("%b %d, %Y %I:%M:%S %p") in an English locale.
+    hour = (dt.hour - 1) % 12 + 1
+    meridiem = "AM" if dt.hour < 12 else "PM"
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year} {hour:02d}:{dt.minute:02d}:{dt.second:02d} {meridiem}"
+
+
 def run_gui(config_path: Path | None = None) -> None:
     LocalFlowGUI(config_path).run()
@@ -1,13 +1,30 @@
 from __future__ import annotations
 
-from collections import deque
+import atexit
 from dataclasses import dataclass
 from datetime import datetime
 import json
+from json.encoder import encode_basestring
+import os
 from pathlib import Path
+import threading
+from typing import TextIO
 
 from localflow.config import history_file_path
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+_TAIL_BLOCK_SIZE = 8192
+# Last read per history file: (st_mtime_ns, st_size, limit, entries). An unchanged
+# file then costs one stat() per GUI poll instead of a read and parse.
+_RECENT_CACHE: dict[Path, tuple[int, int, int, list[HistoryEntry]]] = {}
+# Trimming the file to max_entries rewrites it, so only do it on the first append of
+# a process and then every this many appends; the file overshoots by at most that.
+_TRUNCATE_EVERY_APPENDS = 128
+
 
 @dataclass
 class HistoryEntry:
@@ -16,6 +33,65 @@ class HistoryEntry:
     mode: str
 
 
+class _HistoryAppender:
+    # One line-buffered handle per process: each append is a single write() instead
+    # of open/write/close, and every line still reaches the file immediately.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._handle: TextIO | None = None
+        self._path: Path | None = None
+        self._appends = 0
+        atexit.register(self.close)
+
+    def append(self, path: Path, line: str, max_entries: int) -> None:
+        with self._lock:
+            try:
+                if not self._handle_is_current_locked(path):
+                    self._close_locked()
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    self._handle = path.open("a", encoding="utf-8", buffering=1)
+                    self._path = path
+                self._handle.write(line)
+            except OSError:
+                self._close_locked()
+                return
+
+            if self._appends % _TRUNCATE_EVERY_APPENDS == 0:
+                # Truncation swaps in a new file; reopen on the next append rather than
+                # keep writing to the replaced one.
+                self._close_locked()
+                _truncate_history(path, max_entries=max_entries)
+            self._appends += 1
+
+    def _handle_is_current_locked(self, path: Path) -> bool:
+        # One stat per append catches the file being deleted or swapped out under the
+        # open handle, which would otherwise swallow every later line.
+        if self._handle is None or self._path != path:
+            return False
+        try:
+            on_disk = os.stat(path)
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(self._handle.fileno())
+        return (on_disk.st_dev, on_disk.st_ino) == (opened.st_dev, opened.st_ino)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+        self._handle = None
+        self._path = None
+
+
+_APPENDER = _HistoryAppender()
+
+
 def append_history(
     text: str,
     mode: str = "pre-enhancer",
@@ -27,74 +103,108 @@ def append_history(
         return
 
     target = path or history_file_path()
-    target.parent.mkdir(parents=True, exist_ok=True)
-
-    payload = {
-        "timestamp": datetime.now().astimezone().isoformat(timespec="seconds"),
-        "text": cleaned,
-        "mode": mode,
-    }
-    try:
-        with target.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
-    except OSError:
-        return
-
-    _truncate_history(target, max_entries=max_entries)
+    timestamp = datetime.now().astimezone().isoformat(timespec="seconds")
+    # Formatted directly rather than through a dict and json.dumps: the timestamp never
+    # needs escaping, and encode_basestring is the C string encoder json uses itself.
+    # Short keys keep lines narrow; read_recent_history also accepts the long ones.
+    line = f'{{"t":"{timestamp}","x":{encode_basestring(cleaned)},"m":{encode_basestring(mode)}}}\n'
+    _APPENDER.append(target, line, max_entries=max_entries)
 
 
 def read_recent_history(limit: int = 10, path: Path | None = None) -> list[HistoryEntry]:
     target = path or history_file_path()
-    if limit <= 0 or not target.exists():
+    if limit <= 0:
+        return []
+    try:
+        stat = target.stat()
+    except OSError:
         return []
 
-    lines: deque[str] = deque(maxlen=limit)
+    cached = _RECENT_CACHE.get(target)
+    if cached is not None:
+        mtime_ns, size, cached_limit, entries = cached
+        if (mtime_ns, size) == (stat.st_mtime_ns, stat.st_size) and cached_limit >= limit:
+            return entries[:limit]
+
     try:
-        with target.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                stripped = line.strip()
-                if stripped:
-                    lines.append(stripped)
+        lines = _tail_lines(target, limit)
     except OSError:
         return []
 
     results: list[HistoryEntry] = []
-    for raw in reversed(lines):
+    for raw in lines:
         try:
-            payload = json.loads(raw)
-            timestamp = str(payload.get("timestamp", ""))
-            text = str(payload.get("text", "")).strip()
-            mode = str(payload.get("mode", "pre-enhancer")).strip() or "pre-enhancer"
+            payload = _loads(raw)
+            timestamp = str(payload.get("t", payload.get("timestamp", "")))
+            text = str(payload.get("x", payload.get("text", ""))).strip()
+            mode = str(payload.get("m", payload.get("mode", "pre-enhancer"))).strip() or "pre-enhancer"
             if text:
                 results.append(HistoryEntry(timestamp=timestamp, text=text, mode=mode))
         except Exception:
-            results.append(HistoryEntry(timestamp="", text=raw, mode="unknown"))
-    return results
+            text = raw.decode("utf-8", errors="replace").strip()
+            results.append(HistoryEntry(timestamp="", text=text, mode="unknown"))
+    _RECENT_CACHE[target] = (stat.st_mtime_ns, stat.st_size, limit, results)
+    return results[:]
+
+
+def _tail_lines(path: Path, limit: int) -> list[bytes]:
+    # Reads backwards in blocks, so cost follows ``limit`` rather than the file size.
+    if limit <= 0:
+        return []
+
+    chunks: list[bytes] = []
+    newlines = 0
+    wanted = limit
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        while True:
+            # Count line breaks per block and only join once there are more than the lines
+            # wanted, so each block is scanned a bounded number of times.
+            while position > 0 and newlines <= wanted:
+                step = min(_TAIL_BLOCK_SIZE, position)
+                position -= step
+                handle.seek(position)
+                block = handle.read(step)
+                chunks.append(block)
+                newlines += block.count(b"\n")
+            lines = b"".join(reversed(chunks)).split(b"\n")
+            if position > 0:
+                # The first piece may start mid-line; only the lines after it are complete.
+                lines = lines[1:]
+            kept = [line for line in lines if line and not line.isspace()]
+            if position == 0 or len(kept) >= limit:
+                break
+            # Blank lines used up some of the breaks; read on for the lines still missing.
+            wanted = newlines + limit - len(kept)
+
+    # Left as bytes: the JSON decoders take them directly, so lines are never decoded twice.
+    return kept[-limit:][::-1]
 
 
 def _truncate_history(path: Path, max_entries: int) -> None:
     if max_entries <= 0 or not path.exists():
         return
 
-    kept: deque[str] = deque(maxlen=max_entries)
-    total = 0
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                stripped = line.strip()
-                if not stripped:
-                    continue
-                total += 1
-                kept.append(stripped)
+        kept = _tail_lines(path, max_entries + 1)
     except OSError:
         return
 
-    if total <= max_entries:
+    if len(kept) <= max_entries:
         return
 
+    # Write the surviving tail beside the file and swap it in, so a crash mid-write
+    # never leaves a half-written history.
+    temporary = path.with_name(path.name + ".tmp")
     try:
-        with path.open("w", encoding="utf-8") as handle:
-            for line in kept:
-                handle.write(line + "\n")
+        with temporary.open("wb") as handle:
+            handle.writelines(line + b"\n" for line in reversed(kept[:max_entries]))
+        os.replace(temporary, path)
     except OSError:
         return
+
+
+def _loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -4,10 +4,65 @@ import time
 
 import pyperclip
 
-try:
-    import pyautogui
-except Exception:
-    pyautogui = None
+# pyautogui probes Quartz on import, so it is loaded on the first paste (or by
+# preload_paste_backend) rather than when this module is imported.
+_pyautogui = None
+_pyautogui_loaded = False
+# The system pasteboard via PyObjC, when available, for its cheap changeCount.
+_pasteboard = None
+_pasteboard_loaded = False
+# Upper bound on waiting for a copy to land before pasting anyway.
+_CLIPBOARD_WAIT_SECONDS = 0.1
+_CLIPBOARD_POLL_SECONDS = 0.002
+# "type" mode posts one key event per character, so longer text is pasted instead.
+_TYPE_MAX_CHARS = 32
+
+
+def _get_pyautogui():
+    global _pyautogui, _pyautogui_loaded
+    if not _pyautogui_loaded:
+        try:
+            import pyautogui
+        except Exception:
+            pyautogui = None
+        _pyautogui = pyautogui
+        _pyautogui_loaded = True
+    return _pyautogui
+
+
+def _get_pasteboard():
+    global _pasteboard, _pasteboard_loaded
+    if not _pasteboard_loaded:
+        try:
+            from AppKit import NSPasteboard
+
+            pasteboard = NSPasteboard.generalPasteboard()
+        except Exception:
+            pasteboard = None
+        _pasteboard = pasteboard
+        _pasteboard_loaded = True
+    return _pasteboard
+
+
+def preload_paste_backend() -> None:
+    _get_pyautogui()
+    _get_pasteboard()
+
+
+def _copy_and_wait(text: str) -> None:
+    # Paste as soon as the clipboard holds the new text instead of sleeping a fixed
+    # interval; usually the first check already succeeds.
+    pasteboard = _get_pasteboard()
+    change_count = pasteboard.changeCount() if pasteboard is not None else None
+    pyperclip.copy(text)
+    deadline = time.monotonic() + _CLIPBOARD_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        if change_count is not None:
+            if pasteboard.changeCount() != change_count:
+                return
+        elif pyperclip.paste() == text:
+            return
+        time.sleep(_CLIPBOARD_POLL_SECONDS)
 
 
 def _paste_shortcut() -> tuple[str, str]:
@@ -22,17 +77,19 @@ def emit_text(text: str, auto_paste: bool, paste_mode: str) -> None:
         print(text)
         return
 
-    if paste_mode == "type":
+    pyautogui = _get_pyautogui()
+    # pyautogui.typewrite is only an alias of write, so there is no cheaper typing call.
+    if paste_mode == "type" and len(text) <= _TYPE_MAX_CHARS:
         if pyautogui is None:
             print(text)
             return
         pyautogui.write(text, interval=0.0)
         return
 
-    pyperclip.copy(text)
     if pyautogui is None:
+        pyperclip.copy(text)
         print(text)
         return
-    time.sleep(0.05)
+    _copy_and_wait(text)
     modifier, key = _paste_shortcut()
     pyautogui.hotkey(modifier, key)
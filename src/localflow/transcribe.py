@@ -1,16 +1,66 @@
 from __future__ import annotations
 
+import os
+
 import numpy as np
-from faster_whisper import WhisperModel
+
+# Multiplying by the reciprocal is cheaper than dividing every sample.
+_INT16_SCALE = 1.0 / 32768.0
+# Dictation decodes one short clip at a time, so a few threads give the lowest latency;
+# more mostly add scheduling overhead and cache contention.
+_DEFAULT_CPU_THREADS = min(4, os.cpu_count() or 4)
+
+# Set before ctranslate2 is imported so its OpenMP runtime does not start a thread per
+# core alongside the pool sized by cpu_threads.
+os.environ.setdefault("OMP_NUM_THREADS", str(_DEFAULT_CPU_THREADS))
 
 
 class WhisperTranscriber:
-    def __init__(self, model_name: str = "tiny.en", device: str = "auto") -> None:
-        self.model = WhisperModel(model_name, device=device, compute_type="int8")
+    def __init__(
+        self,
+        model_name: str = "tiny.en",
+        device: str = "auto",
+        compute_type: str = "int8",
+        cpu_threads: int | None = None,
+        num_workers: int = 1,
+        language: str | None = "en",
+        sample_rate: int = 16000,
+    ) -> None:
+        # Imported here: ctranslate2 and onnxruntime are slow to load and only needed
+        # once a model is actually built.
+        from faster_whisper import WhisperModel
+        from faster_whisper.vad import VadOptions
+
+        self.model = WhisperModel(
+            model_name,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=_DEFAULT_CPU_THREADS if cpu_threads is None else cpu_threads,
+            num_workers=num_workers,
+        )
+        # Built once: faster-whisper turns a vad_parameters dict into VadOptions on every
+        # call. The library default min_silence_duration_ms is 2000, so 500 also changes
+        # segmentation: pauses longer than about half a second are cut from the audio
+        # before decoding, not only those of two seconds or more.
+        self._vad_parameters = VadOptions(min_silence_duration_ms=500)
+        # Pay for kernel setup and the Silero VAD load here rather than on the first clip.
+        self.warmup(sample_rate=sample_rate, language=language)
 
-    def transcribe(self, audio: np.ndarray, language: str | None = "en") -> str:
-        if audio.size == 0:
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        language: str | None = "en",
+        initial_prompt: str | None = None,
+    ) -> str:
+        # Accepts float32 in [-1, 1] or the recorder's raw int16 PCM, which is only
+        # widened here so capture and buffering move half the bytes.
+        if not audio.size:
             return ""
+        if audio.dtype == np.int16:
+            audio = audio.astype(np.float32)
+            audio *= _INT16_SCALE
+        # No copy for the contiguous float32 views the recorder hands out.
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
 
         segments, _info = self.model.transcribe(
             audio,
@@ -18,9 +68,38 @@ class WhisperTranscriber:
             beam_size=1,
             best_of=1,
             vad_filter=True,
+            vad_parameters=self._vad_parameters,
             condition_on_previous_text=False,
+            initial_prompt=initial_prompt,
             temperature=0.0,
         )
-        parts = [segment.text.strip() for segment in segments if segment.text and segment.text.strip()]
-        return " ".join(parts).strip()
+        # Strip each segment once; the joined parts are already trimmed and non-empty.
+        stripped = (segment.text.strip() for segment in segments if segment.text)
+        return " ".join(text for text in stripped if text)
 
+    def warmup(self, sample_rate: int = 16000, language: str | None = "en") -> None:
+        silence = np.zeros(sample_rate, dtype=np.float32)
+        # The VAD pass runs inside transcribe() itself, so this loads the Silero model.
+        self.model.transcribe(
+            silence,
+            language=language,
+            beam_size=1,
+            best_of=1,
+            vad_filter=True,
+            vad_parameters=self._vad_parameters,
+            condition_on_previous_text=False,
+            temperature=0.0,
+        )
+        # VAD drops pure silence before the decoder runs, so decode one second
+        # unfiltered to get the model weights paged in and the kernels initialized.
+        segments, _info = self.model.transcribe(
+            silence,
+            language=language,
+            beam_size=1,
+            best_of=1,
+            vad_filter=False,
+            condition_on_previous_text=False,
+            temperature=0.0,
+        )
+        for _segment in segments:
+            pass